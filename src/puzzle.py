@@ -5,6 +5,7 @@ import sys
 import os
 import itertools
 import random
+import concurrent.futures
 import utils
 import animations
 import start_menu
@@ -68,6 +69,10 @@ class PuzzleHustle:
             self.puzzle_height = self.puzzle_width * IMAGE_HEIGHT / IMAGE_WIDTH
         self.scale_factor = self.puzzle_height / IMAGE_HEIGHT
         self.cur_zoom = 1.0
+        self.zoom_executor = concurrent.futures.ThreadPoolExecutor()
+        self.zoom_jobs = []
+        # zoom_jobs keeps track of the pending background refinements of the last zoom. It's items are tuples with the
+        # following elements: [0] = Future of the refined image, [1] = Piece index, [2] = Rotation of the refined image
         pygame.mixer.init()
         self.sound_connected = pygame.mixer.Sound(SOUND_CONNECTED_FILE_NAME)
         self.sound_victory = pygame.mixer.Sound(SOUND_VICTORY_FILE_NAME)
@@ -178,7 +183,10 @@ class PuzzleHustle:
                 elif event.type == STOP_ANIMATION:
                     pygame.time.set_timer(self.anim_play_event, 0)
                     self.update_display()
+            if self.apply_refined_pieces():
+                self.update_display()
             self.clock.tick(FPS)
+        self.zoom_executor.shutdown(wait=True, cancel_futures=True)
         pygame.quit()
 
     def move_piece(self, piece_idx: int, movement: tuple) -> None:
@@ -218,9 +226,7 @@ class PuzzleHustle:
             image_name = os.path.basename(self.dir_name)
             orig_image = pygame.image.load(FILE_NAME.format(dir=self.dir_name, image_name=image_name, row=i, column=j)).convert_alpha()
             cur_state[4] = orig_image
-            scaled_image = pygame.transform.scale(orig_image, (self.piece_width, self.piece_height))
-            scaled_image = pygame.transform.rotate(scaled_image, cur_state[2] * ROTATION_DEGREE)
-            cur_state[0] = scaled_image
+            cur_state[0] = self.render_piece(orig_image, (self.piece_width, self.piece_height), cur_state[2])
             self.piece_states.append(cur_state)
             self.piece_idx_stack.append(cur_idx)
         self.update_display()
@@ -312,15 +318,54 @@ class PuzzleHustle:
         self.piece_width, self.piece_height, self.scale_factor, self.scaled_clipper_size, self.cur_zoom = utils.multiply_tuple(
             (self.piece_width, self.piece_height, self.scale_factor, self.scaled_clipper_size, self.cur_zoom), new_zoom_rel)
         # Perform zoom. Formula for new position: new = center + zoom_factor * (old - center)
+        # To keep the zoom responsive, the currently displayed images are only rescaled cheaply here. The proper images
+        # are computed from the originals in the background and swapped in by apply_refined_pieces once they are done.
+        # Refinements of a previous zoom that haven't started yet are superseded by this one and thus cancelled.
+        self.cancel_refinements()
         center = self.main_surface.get_rect().center
+        piece_size = (self.piece_width, self.piece_height)
         for idx in self.piece_idx_stack:
             self.piece_states[idx][1] = (center[0] + new_zoom_rel * (self.piece_states[idx][1][0] - center[0]),
                                     center[1] + new_zoom_rel * (self.piece_states[idx][1][1] - center[1]))
-            self.piece_states[idx][0] = pygame.transform.scale(self.piece_states[idx][4], (self.piece_width, self.piece_height))
-            if self.piece_states[idx][2] > 0:
-                self.piece_states[idx][0] = pygame.transform.rotate(self.piece_states[idx][0], self.piece_states[idx][2] * ROTATION_DEGREE)
+            rotation = self.piece_states[idx][2]
+            preview_size = piece_size if rotation % 2 == 0 else piece_size[::-1]
+            self.piece_states[idx][0] = pygame.transform.scale(self.piece_states[idx][0], preview_size)
+            future = self.zoom_executor.submit(self.render_piece, self.piece_states[idx][4], piece_size, rotation)
+            self.zoom_jobs.append((future, idx, rotation))
         self.update_display()
 
+    def cancel_refinements(self) -> None:
+        """Cancel all pending background refinements. Refinements that are already running are discarded when done"""
+        for future, _, _ in self.zoom_jobs:
+            future.cancel()
+        self.zoom_jobs = []
+
+    def apply_refined_pieces(self) -> bool:
+        """Swap in the images of all finished background refinements. Return True if any piece was updated"""
+        pending_jobs = []
+        for job in self.zoom_jobs:
+            future, idx, rotation = job
+            if not future.done():
+                pending_jobs.append(job)
+                continue
+            refined_image = future.result()
+            # The piece might have been rotated while the refinement was running
+            missing_rotation = (self.piece_states[idx][2] - rotation) % NUM_ROTATIONS
+            if missing_rotation > 0:
+                refined_image = pygame.transform.rotate(refined_image, missing_rotation * ROTATION_DEGREE)
+            self.piece_states[idx][0] = refined_image
+        updated = len(pending_jobs) < len(self.zoom_jobs)
+        self.zoom_jobs = pending_jobs
+        return updated
+
+    @staticmethod
+    def render_piece(orig_image: pygame.Surface, size: tuple, rotation: int) -> pygame.Surface:
+        """Scale the original image of a piece to the given size and rotate it by the given rotation"""
+        image = pygame.transform.scale(orig_image, size)
+        if rotation > 0:
+            image = pygame.transform.rotate(image, rotation * ROTATION_DEGREE)
+        return image
+
 
 # ------ Main script ------
 if __name__ == "__main__":